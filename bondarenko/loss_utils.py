@@ -177,18 +177,17 @@ def calculate_V_CaT_shared(sol, config):
         phenotype_control = phenotype_control_list[i]
         phenotype_model = phenotype_model_list[i]
 
-        phenotype_control = (
-            phenotype_control - phenotype_model.min(axis=0)
-        ) / phenotype_model.ptp(axis=0)
-        phenotype_model = (
-            phenotype_model - phenotype_model.min(axis=0)
-        ) / phenotype_model.ptp(axis=0)
+        model_min = phenotype_model.min(axis=0)
+        model_ptp = phenotype_model.max(axis=0) - model_min
+        phenotype_control = (phenotype_control - model_min) / model_ptp
+        phenotype_model = (phenotype_model - model_min) / model_ptp
 
         weights = 1 / calculate_mean_abs_noise(phenotype_control)
         weights /= sum(weights)
 
         # rmse = calculate_RMSE_weightened(phenotype_control, phenotype_model, weights)
-        error = (phenotype_control - phenotype_model) ** 2
+        error = phenotype_control - phenotype_model
+        error *= error  # squared error in place, no extra temporaries
         error[:10] *= 10
         error = np.sqrt(np.mean(error, axis=0))
         error *= weights
@@ -66,7 +66,10 @@ def mpi_script(config_filename):
     SolModel.model = model
     SolModel.config = config
 
-    rng = np.random.Generator(np.random.PCG64(config["runtime"]["seed"] + comm_rank))
+    # independent streams for the ranks, reproducible for the given seed
+    seed_sequence = np.random.SeedSequence(config["runtime"]["seed"])
+    seed_sequence_rank = seed_sequence.spawn(comm_size)[comm_rank]
+    rng = np.random.Generator(np.random.PCG64(seed_sequence_rank))
     ga_optim = GA(
         SolModel,
         bounds=config["runtime"]["bounds"],
@@ -44,6 +44,13 @@ def uniform_crossover(g1, g2, rng=None):
 
 
 def sbx_crossover(parent1, parent2, bounds, cross_rate=0.9, rng=None):
+    bounds = np.asarray(bounds, dtype=np.float64)
+    return sbx_crossover_lb_ub(
+        parent1, parent2, bounds[:, 0], bounds[:, 1], cross_rate=cross_rate, rng=rng
+    )
+
+
+def sbx_crossover_lb_ub(parent1, parent2, lb, ub, cross_rate=0.9, rng=None):
 
     if len(parent1) != len(parent2):
         raise ValueError
@@ -60,16 +67,17 @@ def sbx_crossover(parent1, parent2, bounds, cross_rate=0.9, rng=None):
     # to make all if conditions containing rand to be True
 
     return _sbx_crossover(
-        parent1=np.asfarray(parent1),
-        parent2=np.asfarray(parent2),
-        bounds=np.asfarray(bounds),
+        parent1=np.asarray(parent1, dtype=np.float64),
+        parent2=np.asarray(parent2, dtype=np.float64),
+        lb=np.ascontiguousarray(lb, dtype=np.float64),
+        ub=np.ascontiguousarray(ub, dtype=np.float64),
         cross_rate=cross_rate,
         random_sequence=random_sequence,
     )
 
 
-@njit
-def _sbx_crossover(parent1, parent2, bounds, cross_rate, random_sequence):
+@njit(cache=True)
+def _sbx_crossover(parent1, parent2, lb, ub, cross_rate, random_sequence):
     """adopted realcross from NSGA-II: Non-dominated Sorting Genetic Algorithm - II
     Authors: Dr. Kalyanmoy Deb, Sameer Agrawal, Amrit Pratap, T Meyarivan
     Paper Title: A Fast and Elitist multi-objective Genetic Algorithm: NSGA-II
@@ -102,7 +110,7 @@ def _sbx_crossover(parent1, parent2, bounds, cross_rate, random_sequence):
                     if y1 > y2:
                         y1, y2 = y2, y1
 
-                    yl, yu = bounds[j]
+                    yl, yu = lb[j], ub[j]
                     beta = 1.0 + (2.0 * (y1 - yl) / (y2 - y1))
                     alpha = 2.0 - np.power(beta, -(eta_c + 1.0))
                     rand = random_sequence[i_rng]
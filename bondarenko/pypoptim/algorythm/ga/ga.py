@@ -1,23 +1,33 @@
 import copy
+import heapq
 import logging
+import multiprocessing
+from collections import OrderedDict
 
 import numpy as np
+import pandas as pd
 
 from pypoptim.helpers import (
     is_values_inside_bounds,
-    random_value_from_bounds,
+    transform_genes,
     transform_genes_bounds,
     transform_genes_bounds_back,
 )
 
 from ..solution import Solution
-from .crossover import sbx_crossover
-from .mutation import cauchy_mutation_population
-from .selection import tournament_selection
+from .crossover import sbx_crossover_lb_ub
+from .mutation import cauchy_mutation_genes
+from .selection import tournament_selection_indices
 
 logger = logging.getLogger(__name__)
 
 
+def _update_solution(sol):
+    # module-level to be picklable by `multiprocessing.Pool`
+    sol.update()
+    return sol
+
+
 class GA:
     def __init__(
         self,
@@ -30,6 +40,11 @@ class GA:
         crossover_rate=1.0,
         selection_force=2,
         keys_data_transmit=None,
+        fitness_cache_size=0,
+        n_workers=1,
+        mp_start_method=None,
+        pool_initializer=None,
+        pool_initargs=(),
         rng=None,
     ):
 
@@ -40,7 +55,7 @@ class GA:
         else:
             raise TypeError
 
-        bounds = np.asfarray(bounds)
+        bounds = np.ascontiguousarray(bounds, dtype=np.float64)
         if bounds.ndim != 2 or bounds.shape[0] == 0 or bounds.shape[1] != 2:
             raise ValueError
         if np.any(bounds[:, 0] >= bounds[:, 1]):
@@ -69,7 +84,7 @@ class GA:
         if gammas is None:
             self._gammas = np.full(self._n_genes, self._gamma_default)
         else:
-            gammas = np.asfarray(gammas)
+            gammas = np.ascontiguousarray(gammas, dtype=np.float64)
             if len(gammas) != self._n_genes:
                 raise ValueError
             if np.any(gammas <= 0):
@@ -81,6 +96,13 @@ class GA:
         _, self._bounds_transformed = transform_genes_bounds(
             self._bounds[:, 0], self._bounds, self._gammas, self._mask_log10_scale
         )
+        mask_log10_scale = np.asarray(self._mask_log10_scale, dtype=bool)
+        self._lb_scaled, self._ub_scaled = np.array(self._bounds.T)
+        self._lb_scaled[mask_log10_scale] = np.log10(self._lb_scaled[mask_log10_scale])
+        self._ub_scaled[mask_log10_scale] = np.log10(self._ub_scaled[mask_log10_scale])
+        self._lb_transformed = np.ascontiguousarray(self._bounds_transformed[:, 0])
+        self._ub_transformed = np.ascontiguousarray(self._bounds_transformed[:, 1])
+        self._debug = logger.isEnabledFor(logging.DEBUG)
 
         if not (0.0 <= mutation_rate <= 1):
             raise ValueError
@@ -103,6 +125,37 @@ class GA:
         else:
             self._keys_data_transmit = []
 
+        if not isinstance(fitness_cache_size, int):
+            raise TypeError
+        if fitness_cache_size < 0:
+            raise ValueError
+        self._fitness_cache_size = fitness_cache_size
+        self._fitness_cache = OrderedDict()
+
+        if not isinstance(n_workers, int):
+            raise TypeError
+        if n_workers < 1:
+            raise ValueError
+        self._n_workers = n_workers
+
+        # `fork` keeps class attributes set at runtime (e.g. `SolModel.model`);
+        # with `spawn`/`forkserver` workers re-import the modules, so such state
+        # must be restored by `pool_initializer`, and the calling script must be
+        # guarded by `if __name__ == "__main__":`
+        if mp_start_method is None:
+            if "fork" in multiprocessing.get_all_start_methods():
+                mp_start_method = "fork"
+            else:
+                mp_start_method = "spawn"
+        if mp_start_method not in multiprocessing.get_all_start_methods():
+            raise ValueError
+        if pool_initializer is not None and not callable(pool_initializer):
+            raise TypeError
+        self._mp_context = multiprocessing.get_context(mp_start_method)
+        self._pool_initializer = pool_initializer
+        self._pool_initargs = tuple(pool_initargs)
+        self._pool = None
+
         if rng is not None:
             if not isinstance(rng, np.random._generator.Generator):
                 raise TypeError
@@ -130,16 +183,32 @@ class GA:
         s += f"crossover_rate: {self._crossover_rate}\n"
         s += f"selection_force: {self._selection_force}\n"
         s += f"keys_data_transmit: {self._keys_data_transmit}\n"
+        s += f"fitness_cache_size: {self._fitness_cache_size}\n"
+        s += f"n_workers: {self._n_workers}\n"
+        s += f"mp_start_method: {self._mp_context.get_start_method()}\n"
         return s
 
     def __str__(self):
         return self.__repr__()
 
     def _transform_genes(self, genes):
-        genes_transformed, bounds_transformed = transform_genes_bounds(
-            genes, self._bounds, self._gammas, self._mask_log10_scale
+        genes_transformed = transform_genes(
+            genes,
+            self._lb_scaled,
+            self._ub_scaled,
+            self._lb_transformed,
+            self._ub_transformed,
+            self._mask_log10_scale,
         )
-        assert np.allclose(bounds_transformed, self._bounds_transformed)
+        if self._debug:
+            for g, g_transformed in zip(
+                np.atleast_2d(genes), np.atleast_2d(genes_transformed)
+            ):
+                g_transformed_full, bounds_transformed = transform_genes_bounds(
+                    g, self._bounds, self._gammas, self._mask_log10_scale
+                )
+                assert np.allclose(bounds_transformed, self._bounds_transformed)
+                assert np.allclose(g_transformed, g_transformed_full)
         return genes_transformed
 
     def _transform_genes_back(self, genes_transformed):
@@ -151,56 +220,46 @@ class GA:
         )
         return genes
 
-    def _transform_solution(self, sol):
-        sol_transformed = self._SolutionSubclass(
-            self._transform_genes(sol.x), **sol.data
+    @staticmethod
+    def _population_genes(population) -> np.ndarray:
+        return np.stack([sol.x for sol in population])
+
+    def generate_population_matrix(self, n_solutions: int) -> np.ndarray:
+        genes_transformed = self._rng.uniform(
+            self._lb_transformed,
+            self._ub_transformed,
+            size=(n_solutions, self._n_genes),
         )
-        sol_transformed._y = sol.y
-        return sol_transformed
-
-    def _transform_solution_back(self, sol_transformed):
-        genes = self._transform_genes_back(sol_transformed.x)
-        sol = self._SolutionSubclass(genes, **sol_transformed.data)
-        sol._y = sol_transformed.y
-        return sol
+        return self._transform_genes_back(genes_transformed)
 
     def generate_solution(self) -> Solution:
-        genes_transformed = [
-            random_value_from_bounds(self._bounds_transformed[i], rng=self._rng)
-            for i in range(self._n_genes)
-        ]
-        genes_transformed = np.array(genes_transformed)
-        genes = self._transform_genes_back(genes_transformed)
-        sol = self._SolutionSubclass(genes)
-        return sol
+        return self.generate_population(1)[0]
 
     def generate_population(self, n_solutions: int) -> list:
-        return [self.generate_solution() for _ in range(n_solutions)]
-
-    def _transform_population(self, population):
-        return [self._transform_solution(sol) for sol in population]
-
-    def _transform_population_back(self, population):
-        return [self._transform_solution_back(sol) for sol in population]
+        genes = self.generate_population_matrix(n_solutions)
+        return [self._SolutionSubclass(x) for x in genes]
 
     def mutate_population(self, population):
         if not isinstance(population, (list, int)):
             raise TypeError
-        population_new = self._transform_population(population)
-        population_new = self._mutate_population_transformed(population_new)
-        population_new = self._transform_population_back(population_new)
-        return population_new
-
-    def _mutate_population_transformed(self, population):
+        if not len(population):
+            return []
+        genes_transformed = self._transform_genes(self._population_genes(population))
+        genes_transformed = self._mutate_genes_transformed(genes_transformed)
+        genes = self._transform_genes_back(genes_transformed)
+        return [
+            self._SolutionSubclass(x, **sol.data) for sol, x in zip(population, genes)
+        ]
 
-        new_population = cauchy_mutation_population(
-            population,
-            bounds=self._bounds_transformed,
+    def _mutate_genes_transformed(self, genes_transformed):
+        return cauchy_mutation_genes(
+            genes_transformed,
+            lb=self._lb_transformed,
+            ub=self._ub_transformed,
             gamma=self._gamma_default,
             mutation_rate=self._mutation_rate,
             rng=self._rng,
         )
-        return new_population
 
     def mutate_solution(self, sol):
         if not isinstance(sol, self._SolutionSubclass):
@@ -213,18 +272,40 @@ class GA:
 
     def _transmit_solution_data(self, sol_parent: Solution, sol_child: Solution):
         for key in self._keys_data_transmit:
-            sol_child[key] = copy.deepcopy(sol_parent[key])
-
-    def _selection(self, population) -> Solution:  # tournament selection
-        return tournament_selection(
-            np.array(population, dtype=object), self._selection_force, rng=self._rng
-        )
+            value = sol_parent[key]
+            if isinstance(value, np.ndarray):
+                sol_child[key] = value.copy()  # much cheaper than deepcopy
+            elif isinstance(value, (pd.DataFrame, pd.Series)):
+                sol_child[key] = value.copy(deep=True)
+            else:
+                sol_child[key] = copy.deepcopy(value)
+
+    def _select_parents(self, population, n_pairs) -> np.ndarray:
+        if self._selection_force >= len(population):
+            msg = f"Selection force must be less than population size to select distinct parents: {self._selection_force} < {len(population)} is violated"
+            raise ValueError(msg)
+
+        indices_sorted = sorted(range(len(population)), key=lambda i: population[i])
+        ranks = np.empty(len(population), dtype=int)
+        ranks[indices_sorted] = np.arange(len(population))
+
+        parents = np.empty((n_pairs, 2), dtype=int)
+        mask_redraw = np.full(n_pairs, True)
+        while np.any(mask_redraw):  # parents of a pair must be distinct
+            n_redraw = np.count_nonzero(mask_redraw)
+            parents[mask_redraw] = tournament_selection_indices(
+                ranks, 2 * n_redraw, self._selection_force, rng=self._rng
+            ).reshape(n_redraw, 2)
+            mask_redraw = parents[:, 0] == parents[:, 1]
+
+        return parents
 
     def _crossover(self, genes1, genes2) -> tuple:
-        return sbx_crossover(
+        return sbx_crossover_lb_ub(
             genes1,
             genes2,
-            bounds=self._bounds_transformed,
+            lb=self._lb_transformed,
+            ub=self._ub_transformed,
             cross_rate=self._crossover_rate,
             rng=self._rng,
         )
@@ -238,38 +319,47 @@ class GA:
         if size < 0:
             raise ValueError
 
-        population_new = []
+        if size == 0:
+            return []
 
-        while len(population_new) < size:
+        # sbx_crossover creates pairs so the last child is dropped for odd size
+        n_pairs = (size + 1) // 2
+        parents = self._select_parents(population, n_pairs)
+        mask_crossover = self._rng.random(n_pairs) <= self._crossover_rate
 
-            parent1, parent2 = population[0], population[0]
-            while parent1 is parent2:
-                parent1 = self._selection(population)
-                parent2 = self._selection(population)
+        genes_transformed = self._transform_genes(self._population_genes(population))
 
-            parent1_transformed, parent2_transformed = [
-                self._transform_solution(p) for p in (parent1, parent2)
-            ]
+        genes_new = np.empty((2 * n_pairs, self._n_genes))
+        # crossover children get the transmitted data only, others copy the parent
+        parents_data = [None] * (2 * n_pairs)
+
+        for i, ((i1, i2), is_crossover) in enumerate(zip(parents, mask_crossover)):
 
-            if self._rng.random() <= self._crossover_rate:
-                offspring_genes = self._crossover(
-                    parent1_transformed.x, parent2_transformed.x
+            if is_crossover:
+                genes_new[2 * i], genes_new[2 * i + 1] = self._crossover(
+                    genes_transformed[i1], genes_transformed[i2]
                 )
-                parent_data_transmitter = min(parent1_transformed, parent2_transformed)
-                for genes in offspring_genes:
-                    child = self._SolutionSubclass(genes)
-                    self._transmit_solution_data(parent_data_transmitter, child)
-                    population_new.append(child)
+                parent_data_transmitter = min(population[i1], population[i2])
+                parents_data[2 * i] = parent_data_transmitter, True
+                parents_data[2 * i + 1] = parent_data_transmitter, True
             else:  # no crossover
-                child1 = copy.deepcopy(parent1_transformed)
-                child2 = copy.deepcopy(parent2_transformed)
-                population_new += [child1, child2]
+                genes_new[2 * i] = genes_transformed[i1]
+                genes_new[2 * i + 1] = genes_transformed[i2]
+                parents_data[2 * i] = population[i1], False
+                parents_data[2 * i + 1] = population[i2], False
 
-        # sbx_crossover creates pairs so this is for odd size of the population:
-        population_new = population_new[:size]
+        genes_new = self._mutate_genes_transformed(genes_new[:size])
+        genes_new = self._transform_genes_back(genes_new)
 
-        population_new = self._mutate_population_transformed(population_new)
-        population_new = self._transform_population_back(population_new)
+        population_new = []
+        for x, (parent, is_crossover) in zip(genes_new, parents_data):
+            if is_crossover:
+                child = self._SolutionSubclass(x)
+                self._transmit_solution_data(parent, child)
+            else:
+                child = parent.clone()
+                child.x = x
+            population_new.append(child)
 
         return population_new
 
@@ -279,13 +369,80 @@ class GA:
             raise TypeError
         if not (0 <= size <= len(population)):
             raise ValueError
-        elites = sorted(population)[:size]
+        elites = heapq.nsmallest(size, population)
         return elites
 
     @staticmethod
-    def update_population(population) -> None:
+    def _fitness_cache_key(sol) -> bytes:
+        # only genes are hashed: `data` used by `update()` (e.g. the initial
+        # `state` of SolModel) is assumed to be the same for equal genes
+        return np.ascontiguousarray(sol.x).round(decimals=12).tobytes()
+
+    def _fitness_cache_load(self, sol, key) -> None:
+        self._fitness_cache.move_to_end(key)
+        vars(sol).update(copy.deepcopy(self._fitness_cache[key]))
+
+    def _fitness_cache_store(self, sol, key) -> None:
+        # the whole state is kept, subclasses may set more than `_x` and `_y`
+        self._fitness_cache[key] = copy.deepcopy(vars(sol))
+        if len(self._fitness_cache) > self._fitness_cache_size:
+            self._fitness_cache.popitem(last=False)
+
+    def _get_pool(self):
+        # created once and reused across epochs, released by `close`
+        if self._pool is None:
+            self._pool = self._mp_context.Pool(
+                self._n_workers,
+                initializer=self._pool_initializer,
+                initargs=self._pool_initargs,
+            )
+        return self._pool
+
+    def close(self) -> None:
+        if self._pool is not None:
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _update_solutions(self, population) -> None:
+        if self._n_workers == 1 or len(population) < 2:
+            for sol in population:
+                sol.update()
+            return
+
+        population_updated = self._get_pool().map(_update_solution, population)
+        # keep identities of the solutions, only their states come from the workers
+        for sol, sol_updated in zip(population, population_updated):
+            vars(sol).update(vars(sol_updated))
+
+    def update_population(self, population) -> None:
+        # e.g. elites kept from the previous epoch, changing `x` resets `y`
+        population = [sol for sol in population if not sol.is_updated()]
+
+        if self._fitness_cache_size == 0:
+            self._update_solutions(population)
+            return
+
+        misses = {}  # key -> solutions with the same genes
         for sol in population:
-            sol.update()
+            key = self._fitness_cache_key(sol)
+            if key in self._fitness_cache:
+                self._fitness_cache_load(sol, key)
+            else:
+                misses.setdefault(key, []).append(sol)
+
+        self._update_solutions([sols[0] for sols in misses.values()])
+
+        for key, sols in misses.items():
+            self._fitness_cache_store(sols[0], key)
+            for sol in sols[1:]:
+                self._fitness_cache_load(sol, key)
 
     def is_solution_inside_bounds(self, sol, bounds=None) -> bool:
         if bounds is None:
@@ -296,20 +453,30 @@ class GA:
 
         logger.debug("filter_population: START")
 
-        population_filtered = []
-        for i, sol in enumerate(population):
-            if not sol.is_updated():
-                logger.debug(f"  {i}: not updated")
-                continue
-            if not sol.is_valid():
-                logger.debug(f"  {i} not valid")
-                continue
-            if not self.is_solution_inside_bounds(sol):
-                logger.debug(f"  {i} outside bounds")
-                continue
-
-            logger.debug(f"  {i} kept")
-            population_filtered.append(sol)
+        n = len(population)
+
+        mask_updated = np.fromiter((sol.is_updated() for sol in population), bool, n)
+        indices_updated = np.flatnonzero(mask_updated)
+
+        mask_valid = mask_updated.copy()
+        mask_valid[indices_updated] = [
+            population[i].is_valid() for i in indices_updated
+        ]
+        indices_valid = np.flatnonzero(mask_valid)
+
+        mask_kept = mask_valid.copy()
+        if len(indices_valid):
+            genes = self._population_genes([population[i] for i in indices_valid])
+            mask_kept[indices_valid] = np.all(
+                (self._bounds[:, 0] < genes) & (genes < self._bounds[:, 1]), axis=1
+            )
+
+        logger.debug(f"  not updated: {np.flatnonzero(~mask_updated)}")
+        logger.debug(f"  not valid: {np.flatnonzero(mask_updated & ~mask_valid)}")
+        logger.debug(f"  outside bounds: {np.flatnonzero(mask_valid & ~mask_kept)}")
+        logger.debug(f"  kept: {np.flatnonzero(mask_kept)}")
+
+        population_filtered = [sol for sol, kept in zip(population, mask_kept) if kept]
 
         logger.debug("filter_population: END")
 
@@ -333,10 +500,13 @@ class GA:
             raise ValueError
 
         population = self.generate_population(n_solutions)
-        for i in range(n_epochs):
-            self.update_population(population)
-            population = self.filter_population(population)
-            elites = self.get_elites(population, n_elites)
-            mutants = self.get_mutants(population, n_solutions - n_elites)
-            population = elites + mutants
+        try:
+            for i in range(n_epochs):
+                self.update_population(population)
+                population = self.filter_population(population)
+                elites = self.get_elites(population, n_elites)
+                mutants = self.get_mutants(population, n_solutions - n_elites)
+                population = elites + mutants
+        finally:
+            self.close()
         return population
@@ -13,72 +13,71 @@ def cauchy_inverse_cdf(gamma, rng):
 
 def cauchy_mutation(genes, gamma=1, bounds=None, rng=None):  # do not change gamma=1
 
-    if bounds is None:
-        bounds = [[None, None]] * len(genes)
-    else:
+    if bounds is not None:
         if not is_values_inside_bounds(genes, bounds):
             raise ValueError
-    assert len(genes) == len(bounds)
+        assert len(genes) == len(bounds)
 
-    genes_new = []
     if rng is None:
         rng = np.random.default_rng()
     shift = cauchy_inverse_cdf(gamma, rng)
     shift_vec = shift * uniform_vector(len(genes), rng=rng)  # vector mutation
 
-    for gene, (lb, ub), shift in zip(genes, bounds, shift_vec):
-        if lb is not None:
-            gene_new = calculate_reflection(ub, lb, gene, shift)
-        else:
-            gene_new = gene + shift
-        genes_new.append(gene_new)
+    genes = np.asarray(genes, dtype=np.float64)
+    if bounds is not None:
+        lb, ub = np.asarray(bounds, dtype=np.float64).T
+        genes_new = calculate_reflection(ub, lb, genes, shift_vec)
+    else:
+        genes_new = genes + shift_vec
 
-    return genes_new
+    return genes_new.tolist()
 
 
-def cauchy_mutation_population(population, bounds, gamma, mutation_rate, rng=None):
+def cauchy_mutation_genes(genes, lb, ub, gamma, mutation_rate, rng=None):
+    # `genes` is a (n_solutions, n_genes) matrix, each row is mutated as a vector
 
     if rng is None:
         rng = np.random.default_rng()
 
-    if len(population):
+    genes = np.asarray(genes)
+    n_solutions, n_genes = genes.shape
+    if not (n_genes == len(lb) == len(ub)):
+        raise ValueError
 
-        n_genes = len(population[0])
-        if n_genes != len(bounds):
-            raise ValueError
+    if n_solutions == 0:
+        return genes.copy()
 
-        genes = np.concatenate([organism.x.flatten() for organism in population])
+    shifts = gamma * rng.standard_cauchy(n_solutions)
 
-        p = rng.random(len(population))
-        shifts = gamma * np.tan(np.pi * (p - 0.5))
+    mut_mask = rng.random(n_solutions) < mutation_rate
+    shifts = shifts * mut_mask
 
-        mut_mask = rng.random(len(population)) < mutation_rate
-        shifts = shifts * mut_mask
+    u = rng.standard_normal(n_genes * n_solutions).reshape((n_genes, n_solutions))
+    u = u / np.linalg.norm(u, axis=1)[:, None]
+    u = u.reshape((n_solutions, n_genes))
 
-        shifts = np.tile(shifts, (n_genes, 1)).T.flatten()
+    shifts = shifts[:, None] * u
 
-        u = rng.standard_normal(n_genes * len(population)).reshape(
-            (n_genes, len(population))
-        )
-        u = u / np.linalg.norm(u, axis=1)[:, None]
-        u = u.flatten()
+    if not np.all((lb < genes) & (genes < ub)):
+        raise ValueError
 
-        shifts = shifts * u
-        bounds = np.tile(bounds, (len(population), 1))
-        lb, ub = bounds.T
+    return calculate_reflection(ub, lb, genes, shifts)
 
-        if not is_values_inside_bounds(genes, bounds):
-            raise ValueError
 
-        genes = calculate_reflection(ub, lb, genes, shifts)
-        genes = np.reshape(genes, (len(population), n_genes))
+def cauchy_mutation_population(population, bounds, gamma, mutation_rate, rng=None):
+
+    if not len(population):
+        return []
 
-    else:
-        genes = []
+    bounds = np.asarray(bounds, dtype=np.float64)
+    genes = np.stack([organism.x for organism in population])
+    genes = cauchy_mutation_genes(
+        genes, bounds[:, 0], bounds[:, 1], gamma, mutation_rate, rng=rng
+    )
 
     mutants = copy.deepcopy(population)
 
-    for i in range(len(mutants)):
-        mutants[i].x = genes[i]
+    for mutant, x in zip(mutants, genes):
+        mutant.x = x
 
     return mutants
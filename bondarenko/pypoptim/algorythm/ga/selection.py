@@ -7,4 +7,29 @@ def tournament_selection(population, selection_force=2, rng=None):
     if selection_force > len(population):
         msg = f"Selection force must be less than population size: {selection_force} <= {len(population)} is violated"
         raise ValueError(msg)
-    return min(rng.choice(a=population, size=selection_force, replace=False))
+    indices = rng.choice(len(population), size=selection_force, replace=False)
+    return min(population[i] for i in indices)
+
+
+def tournament_selection_indices(ranks, size, selection_force=2, rng=None):
+    # vectorized `tournament_selection` over `size` tournaments at once;
+    # `ranks[i]` is the rank of the i-th solution (0 is the best),
+    # returns the indices of the winners
+    ranks = np.asarray(ranks)
+    if rng is None:
+        rng = np.random.default_rng()
+    if selection_force > len(ranks):
+        msg = f"Selection force must be less than population size: {selection_force} <= {len(ranks)} is violated"
+        raise ValueError(msg)
+
+    # Floyd's sampling of distinct participants, vectorized over tournaments:
+    # O(size * selection_force) memory, no rejection
+    n = len(ranks)
+    participants = np.empty((size, selection_force), dtype=np.int64)
+    for i, j in enumerate(range(n - selection_force, n)):
+        t = rng.integers(0, j + 1, size=size)
+        mask_taken = np.any(participants[:, :i] == t[:, None], axis=1)
+        participants[:, i] = np.where(mask_taken, j, t)
+
+    i_best = np.argmin(ranks[participants], axis=1)
+    return participants[np.arange(size), i_best]
@@ -7,7 +7,7 @@ import numpy as np
 class Solution:
     def __init__(self, x, **kwargs_data):
 
-        x = np.asfarray(x)
+        x = np.asarray(x, dtype=np.float64)
         if x.ndim != 1 or x.shape[0] == 0:
             raise ValueError
 
@@ -70,7 +70,7 @@ class Solution:
 
     @x.setter
     def x(self, x_new):
-        x_new = np.asfarray(x_new)
+        x_new = np.asarray(x_new, dtype=np.float64)
         if x_new.ndim != 1 or x_new.shape[0] == 0:
             raise ValueError
         self._x = x_new
@@ -92,6 +92,16 @@ class Solution:
             raise ValueError
         self._data = data
 
+    def clone(self):
+        # cheaper than `copy.deepcopy`: arrays are copied without the copy protocol
+        sol = copy.copy(self)
+        sol._x = self._x.copy()
+        sol._data = {
+            key: value.copy() if isinstance(value, np.ndarray) else copy.deepcopy(value)
+            for key, value in self._data.items()
+        }
+        return sol
+
     def update(self, *args, **kwargs) -> None:
         raise NotImplementedError("You must implement this method on your side!")
 
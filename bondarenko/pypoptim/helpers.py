@@ -37,7 +37,8 @@ def batches_from_list(l, n_batches=1):
 
 
 def is_values_inside_bounds(values, bounds):
-    values, bounds = map(np.asfarray, [values, bounds])
+    values = np.asarray(values, dtype=np.float64)
+    bounds = np.asarray(bounds, dtype=np.float64)
     return np.all((bounds[:, 0] < values) & (values < bounds[:, 1]))
 
 
@@ -71,7 +72,7 @@ def calculate_mean_abs_noise(array, n=31):
     return noise
 
 
-@njit
+@njit(cache=True)
 def transform_genes_bounds(
     genes, bounds, gammas, mask_log10_scale, scale_dimensions=True
 ):
@@ -107,27 +108,45 @@ def transform_genes_bounds(
     return genes_transformed, bounds_transformed
 
 
-@njit
+def transform_genes(genes, lb, ub, lb_transformed, ub_transformed, mask_log10_scale):
+    # affine part of `transform_genes_bounds` with precomputed bounds: `lb` and `ub`
+    # must be already log10-scaled where `mask_log10_scale` is set;
+    # genes may be a single solution or a (n_solutions, n_genes) matrix
+    genes_transformed = np.array(genes, dtype=np.float64)
+    if not (genes_transformed.shape[-1] == len(lb) == len(ub) == len(mask_log10_scale)):
+        raise ValueError("Invalid arrays' lengths")
+
+    mask_log10_scale = np.asarray(mask_log10_scale, dtype=bool)
+    genes_transformed[..., mask_log10_scale] = np.log10(
+        genes_transformed[..., mask_log10_scale]
+    )
+
+    return lb_transformed + (genes_transformed - lb) / (ub - lb) * (
+        ub_transformed - lb_transformed
+    )
+
+
 def transform_genes_bounds_back(
     genes_transformed, bounds_transformed, bounds_back, mask_log10_scale
 ):
-    if not (len(genes_transformed) == len(bounds_transformed) == len(mask_log10_scale)):
+    # genes_transformed may be a single solution or a (n_solutions, n_genes) matrix
+    genes_transformed = np.asarray(genes_transformed)
+    if not (
+        genes_transformed.shape[-1] == len(bounds_transformed) == len(mask_log10_scale)
+    ):
         raise ValueError("Invalid arrays' lengths")
 
-    genes_back = np.zeros_like(genes_transformed)
+    mask_log10_scale = np.asarray(mask_log10_scale, dtype=bool)
 
-    for i, (gene, (lb_back, ub_back), (lb_tran, ub_tran), is_log10) in enumerate(
-        zip(genes_transformed, bounds_back, bounds_transformed, mask_log10_scale)
-    ):  # log10 scale
-        if is_log10:
-            genes_back[i] = np.log10(lb_back) + (gene - lb_tran) / (
-                ub_tran - lb_tran
-            ) * (np.log10(ub_back) - np.log10(lb_back))
-            genes_back[i] = np.power(10, genes_back[i])
-        else:  # linear scale
-            genes_back[i] = lb_back + (gene - lb_tran) / (ub_tran - lb_tran) * (
-                ub_back - lb_back
-            )
+    lb_back, ub_back = np.array(bounds_back, dtype=float).T
+    lb_back[mask_log10_scale] = np.log10(lb_back[mask_log10_scale])
+    ub_back[mask_log10_scale] = np.log10(ub_back[mask_log10_scale])
+    lb_tran, ub_tran = np.asarray(bounds_transformed).T
+
+    genes_back = lb_back + (genes_transformed - lb_tran) / (ub_tran - lb_tran) * (
+        ub_back - lb_back
+    )
+    genes_back[..., mask_log10_scale] = np.power(10, genes_back[..., mask_log10_scale])
 
     return genes_back
 
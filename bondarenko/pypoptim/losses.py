@@ -1,24 +1,46 @@
 import numpy as np
-from sklearn.metrics import mean_squared_error as MSE
 
 
 def RMSE(x, y, *, sample_weight=None, multioutput="uniform_average"):
-    return MSE(
-        x, y, squared=False, sample_weight=sample_weight, multioutput=multioutput
-    )
+    # same as sklearn's `mean_squared_error(..., squared=False)`
+    x, y = np.asarray(x, dtype=np.float64), np.asarray(y, dtype=np.float64)
+    x, y = x.reshape(len(x), -1), y.reshape(len(y), -1)
+    if x.shape != y.shape:
+        raise ValueError(f"Inconsistent shapes: {x.shape} and {y.shape}")
+    d = x - y
+
+    if sample_weight is None:
+        mse_raw = np.einsum("ij,ij->j", d, d) / len(d)
+    else:
+        sample_weight = np.asarray(sample_weight, dtype=np.float64)
+        if sample_weight.shape != (len(d),):
+            raise ValueError(f"Invalid sample_weight shape: {sample_weight.shape}")
+        mse_raw = np.einsum("i,ij,ij->j", sample_weight, d, d) / np.sum(sample_weight)
+    rmse_raw = np.sqrt(mse_raw)
+
+    if isinstance(multioutput, str):
+        if multioutput == "raw_values":
+            return rmse_raw
+        if multioutput == "uniform_average":
+            return float(np.mean(rmse_raw))
+        raise ValueError(f"Unknown multioutput: {multioutput}")
+    return float(np.average(rmse_raw, weights=multioutput))
 
 
 def calculate_RMSE(x, y) -> float:
     assert len(x) == len(y)  # TODO
-    return np.sqrt(np.mean(((x - y) ** 2)))
+    d = x - y
+    return float(np.sqrt(np.vdot(d, d) / d.size))
 
 
 def calculate_RMSE_balanced(x, y) -> float:
     assert len(x) == len(y)  # TODO
-    x = (x - y.min(axis=0)) / y.ptp(axis=0)
-    y = (y - y.min(axis=0)) / y.ptp(axis=0)
-    return np.sqrt(np.sum(((x - y) ** 2)) / len(x))
+    x, y = np.asarray(x), np.asarray(y)
+    y_min = y.min(axis=0)
+    y_ptp = y.max(axis=0) - y_min
+    d = (x - y_min) / y_ptp - (y - y_min) / y_ptp
+    return np.sqrt(np.vdot(d, d) * (1.0 / len(x)))
 
 
 def calculate_RMSE_weightened(x, y, weights) -> float:
-    return float(np.sum(MSE(x, y, squared=False, multioutput="raw_values") * weights))
+    return float(RMSE(x, y, multioutput="raw_values") @ weights)
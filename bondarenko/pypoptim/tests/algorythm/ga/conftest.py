@@ -7,7 +7,7 @@ from pypoptim.algorythm.ga import GA
 @pytest.fixture()
 def ga_optim_fabric(square_solution):
     def _ga_optim_fabric(**kw):
-        bounds = np.asfarray([[-1, 1], [2, 4]])
+        bounds = np.asarray([[-1, 1], [2, 4]], dtype=np.float64)
         rng = np.random.default_rng(42)
         return GA(SolutionSubclass=square_solution, bounds=bounds, rng=rng, **kw)
 
@@ -4,6 +4,7 @@ import pytest
 from ....algorythm.ga.crossover import (
     one_point_crossover,
     sbx_crossover,
+    sbx_crossover_lb_ub,
     two_point_crossover,
     uniform_crossover,
 )
@@ -53,3 +54,25 @@ def test_sbx_crossover():
 
     for child_1, child_2 in zip(children1, children2):
         assert np.all(child_1 == child_2)
+
+
+def test_sbx_crossover_lb_ub():
+    bounds = np.array([[-3, 3], [-1, 1], [0, 2]], dtype=float)
+    parents = [[1.5, 0.1, 1], [0, 0, 0]]
+    seed = 888
+    children1 = sbx_crossover(
+        parent1=parents[0],
+        parent2=parents[1],
+        bounds=bounds,
+        rng=np.random.default_rng(seed),
+    )
+    children2 = sbx_crossover_lb_ub(
+        parent1=parents[0],
+        parent2=parents[1],
+        lb=bounds[:, 0],
+        ub=bounds[:, 1],
+        rng=np.random.default_rng(seed),
+    )
+
+    for child_1, child_2 in zip(children1, children2):
+        assert np.all(child_1 == child_2)
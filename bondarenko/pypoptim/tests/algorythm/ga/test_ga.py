@@ -1,10 +1,33 @@
 import numpy as np
+import pandas as pd
 import pytest
 
 from ....algorythm.ga import GA
 from ....algorythm.solution import Solution
 
 
+class SquareSolutionPicklable(Solution):
+    def update(self):
+        self._y = np.sum(self.x ** 2)
+
+    def is_valid(self):
+        return self.is_updated()
+
+
+class ScaledSolution(Solution):
+    scale = None  # set at runtime, like `SolModel.model`
+
+    def update(self):
+        self._y = self.scale * np.sum(self.x ** 2)
+
+    def is_valid(self):
+        return self.is_updated()
+
+
+def _set_scale(scale):
+    ScaledSolution.scale = scale
+
+
 class TestGA:
     def test_init_invalid(self):
         class SquareSolution(Solution):
@@ -80,6 +103,20 @@ class TestGA:
                     keys_data_transmit=invalid,
                 )
 
+        with pytest.raises(TypeError):
+            GA(SolutionSubclass=SquareSolution, bounds=bounds, fitness_cache_size=1.0)
+        with pytest.raises(ValueError):
+            GA(SolutionSubclass=SquareSolution, bounds=bounds, fitness_cache_size=-1)
+
+        with pytest.raises(TypeError):
+            GA(SolutionSubclass=SquareSolution, bounds=bounds, n_workers=2.0)
+        with pytest.raises(ValueError):
+            GA(SolutionSubclass=SquareSolution, bounds=bounds, mp_start_method="spam")
+        with pytest.raises(TypeError):
+            GA(SolutionSubclass=SquareSolution, bounds=bounds, pool_initializer=42)
+        with pytest.raises(ValueError):
+            GA(SolutionSubclass=SquareSolution, bounds=bounds, n_workers=0)
+
         invalids = "rng", 42
         for invalid in invalids:
             with pytest.raises(TypeError):
@@ -123,6 +160,26 @@ class TestGA:
             ga_optim_default.is_solution_inside_bounds(sol) for sol in population
         )
 
+    def test_generate_population_matrix(self, ga_optim_default):
+        n = 42
+        genes = ga_optim_default.generate_population_matrix(n)
+        assert genes.shape == (n, len(ga_optim_default.bounds))
+        bounds = ga_optim_default.bounds
+        assert np.all((bounds[:, 0] <= genes) & (genes <= bounds[:, 1]))
+
+    def test_transform_genes(self, ga_optim_default):
+        n = 5
+        population = ga_optim_default.generate_population(n)
+        genes = ga_optim_default._population_genes(population)
+        assert genes.shape == (n, len(ga_optim_default.bounds))
+
+        genes_transformed = ga_optim_default._transform_genes(genes)
+        for sol, x_transformed in zip(population, genes_transformed):
+            assert np.allclose(x_transformed, ga_optim_default._transform_genes(sol.x))
+
+        genes_back = ga_optim_default._transform_genes_back(genes_transformed)
+        assert np.allclose(genes, genes_back)
+
     def test_update_population(self, ga_optim_default):
         n = 42
         population = ga_optim_default.generate_population(n)
@@ -131,6 +188,115 @@ class TestGA:
         ga_optim_default.update_population(population)
         assert all(sol.is_updated() for sol in population)
 
+        population[0]._y = -1  # already updated, must be skipped
+        population[1].x = population[1].x  # makes this solution not updated
+        ga_optim_default.update_population(population)
+        assert population[0].y == -1
+        assert all(sol.is_updated() for sol in population)
+
+    def test_update_population_fitness_cache(self, ga_optim_fabric):
+        ga_optim = ga_optim_fabric(fitness_cache_size=2)
+        n_calls = []
+
+        class SS(ga_optim._SolutionSubclass):
+            def update(self):
+                n_calls.append(1)
+                super().update()
+
+        ga_optim._SolutionSubclass = SS
+
+        n = 3
+        population = ga_optim.generate_population(n)
+        ga_optim.update_population(population)
+        assert len(n_calls) == n
+
+        duplicates = [SS(sol.x.copy()) for sol in population[1:]]
+        ga_optim.update_population(duplicates)
+        assert len(n_calls) == n  # cache hits
+        for sol, sol_duplicate in zip(population[1:], duplicates):
+            assert sol_duplicate.is_updated()
+            assert sol_duplicate == sol
+
+        evicted = SS(population[0].x.copy())
+        ga_optim.update_population([evicted])
+        assert len(n_calls) == n + 1
+        assert evicted == population[0]
+
+    def test_update_population_fitness_cache_state(self, ga_optim_fabric):
+        ga_optim = ga_optim_fabric(fitness_cache_size=10)
+
+        class SS(ga_optim._SolutionSubclass):
+            def update(self):
+                super().update()
+                self._status = 2
+                self["phenotype"] = np.full(3, self.y)
+
+            def is_valid(self):
+                return self.is_updated() and getattr(self, "_status", None) == 2
+
+        ga_optim._SolutionSubclass = SS
+
+        n = 3
+        population = ga_optim.generate_population(n)
+        ga_optim.update_population(population)
+
+        duplicates = [SS(sol.x.copy()) for sol in population]
+        ga_optim.update_population(duplicates)
+        for sol, sol_duplicate in zip(population, duplicates):
+            assert sol_duplicate.is_valid()
+            assert np.all(sol_duplicate["phenotype"] == sol["phenotype"])
+            assert sol_duplicate["phenotype"] is not sol["phenotype"]
+
+        assert len(ga_optim.filter_population(duplicates)) == n
+
+    @pytest.mark.parametrize("fitness_cache_size", [0, 10])
+    def test_update_population_parallel(self, fitness_cache_size):
+        bounds = [[-1, 1], [2, 4]]
+        ga_optim = GA(
+            SolutionSubclass=SquareSolutionPicklable,
+            bounds=bounds,
+            fitness_cache_size=fitness_cache_size,
+            n_workers=2,
+            rng=np.random.default_rng(42),
+        )
+        n = 42
+        population = ga_optim.generate_population(n)
+        population.append(SquareSolutionPicklable(population[0].x.copy()))
+        population_ids = [id(sol) for sol in population]
+
+        ga_optim.update_population(population)
+        ga_optim.close()
+        assert [id(sol) for sol in population] == population_ids
+        for sol in population:
+            assert sol.is_updated()
+            assert sol.y == np.sum(sol.x ** 2)
+
+    @pytest.mark.parametrize("mp_start_method", ["fork", "spawn"])
+    def test_update_population_parallel_class_state(self, mp_start_method):
+        scale = 3.0
+        _set_scale(scale)
+        bounds = [[-1, 1], [2, 4]]
+        with GA(
+            SolutionSubclass=ScaledSolution,
+            bounds=bounds,
+            n_workers=2,
+            mp_start_method=mp_start_method,
+            pool_initializer=_set_scale,  # `spawn` workers re-import the module
+            pool_initargs=(scale,),
+            rng=np.random.default_rng(42),
+        ) as ga_optim:
+            population = ga_optim.generate_population(4)
+            ga_optim.update_population(population)
+            pool = ga_optim._pool
+
+            population += ga_optim.generate_population(4)
+            ga_optim.update_population(population)
+            assert ga_optim._pool is pool  # reused across calls
+
+            for sol in population:
+                assert sol.y == scale * np.sum(sol.x ** 2)
+        assert ga_optim._pool is None
+
     def test_filter_population(self, ga_optim_for_is_valid):
         n = 42
         population = ga_optim_for_is_valid.generate_population(n)
@@ -189,6 +355,12 @@ class TestGA:
         with pytest.raises(ValueError):
             ga_optim_with_data.get_mutants(population, -1)
 
+        ga_optim_with_data._selection_force = len(population)
+        assert ga_optim_with_data.get_mutants(population, 0) == []
+        with pytest.raises(ValueError):
+            ga_optim_with_data.get_mutants(population, 1)
+        ga_optim_with_data._selection_force = 2
+
         ga_optim_with_data._crossover_rate = 0
         ga_optim_with_data._mutation_rate = 0
 
@@ -257,3 +429,15 @@ class TestGA:
 
         parent["spam"].append("X")
         assert child["spam"] != parent["spam"]  # child had copy of the `spam`
+
+        parent["state"] = np.arange(3.0)
+        ga_optim_with_data._transmit_solution_data(sol_parent=parent, sol_child=child)
+        assert np.all(child["state"] == parent["state"])
+        parent["state"][0] = 42
+        assert child["state"][0] == 0  # child had copy of the `state`
+
+        parent["state"] = pd.DataFrame({"V": np.arange(3.0), "Cai": np.ones(3)})
+        ga_optim_with_data._transmit_solution_data(sol_parent=parent, sol_child=child)
+        pd.testing.assert_frame_equal(child["state"], parent["state"])
+        parent["state"].loc[0, "V"] = 42
+        assert child["state"].loc[0, "V"] == 0  # child had copy of the `state`
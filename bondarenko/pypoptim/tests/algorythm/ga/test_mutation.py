@@ -46,7 +46,7 @@ def test_cauchy_mutation():
 
 
 def test_cauchy_mutation_population(population):
-    bounds = np.asfarray([[-5, 5], [3, 13]])
+    bounds = np.asarray([[-5, 5], [3, 13]], dtype=np.float64)
     n_organisms = 0
     p = population(n_organisms, bounds=bounds)
     new_p = cauchy_mutation_population(
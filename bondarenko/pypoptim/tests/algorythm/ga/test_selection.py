@@ -1,4 +1,10 @@
-from ....algorythm.ga.selection import tournament_selection
+import numpy as np
+import pytest
+
+from ....algorythm.ga.selection import (
+    tournament_selection,
+    tournament_selection_indices,
+)
 
 
 def test_tournament_selection():
@@ -6,3 +12,34 @@ def test_tournament_selection():
     assert tournament_selection(p) == p[1]
     p.append(-1)
     assert tournament_selection(p, selection_force=3) == p[-1]
+
+
+def test_tournament_selection_indices():
+    ranks = [2, 0, 1]
+    rng = np.random.default_rng(42)
+
+    winners = tournament_selection_indices(ranks, size=100, rng=rng)
+    assert len(winners) == 100
+    assert set(winners) == {1, 2}  # the worst never wins with distinct participants
+
+    winners = tournament_selection_indices(ranks, size=10, selection_force=3, rng=rng)
+    assert np.all(winners == 1)
+
+    winners = tournament_selection_indices(
+        np.arange(12), size=1000, selection_force=11, rng=rng
+    )
+    assert set(winners) <= {0, 1}
+
+    # large population: memory must not scale as size * len(ranks)
+    n = 10 ** 6
+    winners = tournament_selection_indices(np.arange(n), size=n, rng=rng)
+    assert len(winners) == n
+    assert np.all((0 <= winners) & (winners < n))
+
+    # participants are uniform pairs, so i-th solution wins with probability i / 10
+    winners = tournament_selection_indices(-np.arange(5), size=10000, rng=rng)
+    counts = np.bincount(winners, minlength=5)
+    assert np.allclose(counts / counts.sum(), [0, 0.1, 0.2, 0.3, 0.4], atol=0.05)
+
+    with pytest.raises(ValueError):
+        tournament_selection_indices(ranks, size=1, selection_force=4)
@@ -61,6 +61,24 @@ class TestSolution:
         assert not sol.is_updated()
         assert not sol.is_valid()
 
+    def test_clone(self, square_solution):
+        sol = square_solution([1, 2], state=np.zeros(3), spam=["s", "p"])
+        sol.update()
+
+        sol_clone = sol.clone()
+        assert type(sol_clone) is type(sol)
+        assert np.all(sol_clone.x == sol.x)
+        assert sol_clone.y == sol.y
+        assert np.all(sol_clone["state"] == sol["state"])
+        assert sol_clone["spam"] == sol["spam"]
+
+        sol.x[0] = 42
+        sol["state"][0] = 42
+        sol["spam"].append("a")
+        assert sol_clone.x[0] == 1
+        assert sol_clone["state"][0] == 0
+        assert sol_clone["spam"] == ["s", "p"]
+
     def test_comparators(self, maxabs_solution):
         def zip_product(xs, sols):
             return zip(itertools.product(xs, xs), itertools.product(sols, sols))
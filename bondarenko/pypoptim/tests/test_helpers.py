@@ -6,6 +6,7 @@ from ..helpers import (
     argmin,
     calculate_reflection,
     random_value_from_bounds,
+    transform_genes,
     transform_genes_bounds,
     transform_genes_bounds_back,
     uniform_vector,
@@ -54,12 +55,34 @@ def test_transform_genes():
 
     assert np.allclose(bounds_transformed[:, 1], np.array([0.5, 0.5, 0.25, 1.0]))
 
+    lb_scaled, ub_scaled = bounds.T.copy()
+    lb_scaled[mask_multipliers] = np.log10(lb_scaled[mask_multipliers])
+    ub_scaled[mask_multipliers] = np.log10(ub_scaled[mask_multipliers])
+    assert np.allclose(
+        transform_genes(
+            genes,
+            lb_scaled,
+            ub_scaled,
+            bounds_transformed[:, 0],
+            bounds_transformed[:, 1],
+            mask_multipliers,
+        ),
+        genes_transformed,
+    )
+
     genes_back = transform_genes_bounds_back(
         genes_transformed, bounds_transformed, bounds, mask_multipliers
     )
 
     assert np.allclose(genes, genes_back)
 
+    genes_back = transform_genes_bounds_back(
+        np.vstack([genes_transformed] * 3), bounds_transformed, bounds, mask_multipliers
+    )
+
+    assert genes_back.shape == (3, len(genes))
+    assert np.allclose(genes, genes_back)
+
 
 @pytest.mark.parametrize(
     "shifts,genes_expected,ub,lb,values",
@@ -1,13 +1,74 @@
+import numpy as np
 import pytest
 
-from ..losses import calculate_RMSE_balanced, calculate_RMSE_weightened
+from ..losses import (
+    RMSE,
+    calculate_RMSE,
+    calculate_RMSE_balanced,
+    calculate_RMSE_weightened,
+)
+
+
+def test_RMSE():
+    rng = np.random.default_rng(42)
+    for shape in (100,), (100, 1), (100, 3):
+        x, y = rng.random(shape), rng.random(shape)
+        rmse_raw = np.sqrt(np.mean((x - y) ** 2, axis=0))
+        assert np.isclose(RMSE(x, y), np.mean(rmse_raw))
+        assert RMSE(x, x) == 0
+
+    x, y = rng.random((100, 3)), rng.random((100, 3))
+    assert np.allclose(
+        RMSE(x, y, multioutput="raw_values"),
+        np.sqrt(np.mean((x - y) ** 2, axis=0)),
+    )
+
+    sample_weight = rng.random(100)
+    rmse_raw = np.sqrt(np.average((x - y) ** 2, axis=0, weights=sample_weight))
+    assert np.allclose(
+        RMSE(x, y, sample_weight=sample_weight, multioutput="raw_values"), rmse_raw
+    )
+    assert np.isclose(RMSE(x, y, sample_weight=sample_weight), np.mean(rmse_raw))
+
+    multioutput = [0.2, 0.3, 0.5]
+    assert np.isclose(
+        RMSE(x, y, sample_weight=sample_weight, multioutput=multioutput),
+        np.average(rmse_raw, weights=multioutput),
+    )
+
+    with pytest.raises(ValueError):
+        RMSE(x, y[:, :2])
+    with pytest.raises(ValueError):
+        RMSE(x, y, multioutput="spam")
+
+
+def test_calculate_RMSE():
+    rng = np.random.default_rng(42)
+    for shape in (100,), (100, 3):
+        x, y = rng.random(shape), rng.random(shape)
+        assert np.isclose(calculate_RMSE(x, y), np.sqrt(np.mean((x - y) ** 2)))
 
 
-@pytest.mark.xfail
 def test_calculate_RMSE_balanced():
-    assert 0
+    rng = np.random.default_rng(42)
+    for shape in (100,), (100, 2):
+        x, y = rng.random(shape), rng.random(shape)
+        y_scaled = (y - y.min(axis=0)) / np.ptp(y, axis=0)
+        x_scaled = (x - y.min(axis=0)) / np.ptp(y, axis=0)
+        expected = np.sqrt(np.sum((x_scaled - y_scaled) ** 2) / len(x))
+        assert np.isclose(calculate_RMSE_balanced(x, y), expected)
+
+    assert calculate_RMSE_balanced(y, y) == 0
 
 
-@pytest.mark.xfail
 def test_calculate_RMSE_weightened():
-    assert 0
+    rng = np.random.default_rng(42)
+    x, y = rng.random((100, 3)), rng.random((100, 3))
+    weights = np.array([0.2, 0.3, 0.5])
+    expected = np.sum(np.sqrt(np.mean((x - y) ** 2, axis=0)) * weights)
+    assert np.isclose(calculate_RMSE_weightened(x, y, weights), expected)
+    assert calculate_RMSE_weightened(x, x, weights) == 0
+
+    x, y = x[:, 0], y[:, 0]  # single trace
+    expected = np.sqrt(np.mean((x - y) ** 2))
+    assert np.isclose(calculate_RMSE_weightened(x, y, [1.0]), expected)
@@ -7,5 +7,5 @@ setup(
     url="https://github.com/humanphysiologylab/pypoptim",
     author="Andrey Pikunov",
     author_email="pikunov@phystech.edu",
-    install_requires=["numpy", "pandas", "scikit-learn", "numba", "pytest"],
+    install_requires=["numpy", "pandas", "numba", "pytest"],
 )